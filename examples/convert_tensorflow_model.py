@@ -10,61 +10,75 @@ import numpy as np
 import tensorflow as tf
 from pathlib import Path
 
+import tf2onnx
+
 # Import the wronai_edge package
 from wronai_edge.models import (
-    convert_keras_model,
     convert_saved_model,
     convert_tf_function,
     get_model_signature
 )
 
 def create_sample_keras_model():
-    """Create a simple Keras model for demonstration."""
+    """Create a simple Keras model for demonstration.
+
+    The model is only exported, never trained, so it is deliberately not
+    compiled — compile() would build an optimizer and loss graph that the
+    converter throws away.
+    """
     model = tf.keras.Sequential([
         tf.keras.layers.Dense(64, activation='relu', input_shape=(10,)),
         tf.keras.layers.Dense(32, activation='relu'),
         tf.keras.layers.Dense(1, activation='sigmoid')
     ])
-    model.compile(optimizer='adam', loss='binary_crossentropy')
     return model
 
-def save_keras_model(model, path):
-    """Save a Keras model to the specified path."""
-    model.save(path)
-    print(f"Saved Keras model to {path}")
+def get_concrete_function(model, input_spec):
+    """Wrap a Keras model in a tf.function and trace it once.
+
+    The cached concrete function can be handed straight to tf2onnx without a
+    SavedModel round-trip through the filesystem.
+    """
+    return tf.function(model).get_concrete_function(input_spec)
 
 def convert_keras_model_example():
     """Example of converting a Keras model to ONNX."""
     print("\n=== Converting Keras Model to ONNX ===")
-    
-    # Create and save a sample Keras model
+
+    # Create a sample Keras model and trace it once
     model = create_sample_keras_model()
-    keras_model_path = "models/sample_keras_model"
-    save_keras_model(model, keras_model_path)
-    
-    # Convert to ONNX
+    spec = tf.TensorSpec((None, 10), tf.float32, name='input')
+    func = tf.function(model)
+    func.get_concrete_function(spec)  # trace now; the conversion reuses it
+
+    # Convert to ONNX directly from the in-memory function
     onnx_path = "models/keras_model.onnx"
-    convert_keras_model(
-        model_path=keras_model_path,
-        output_path=onnx_path,
-        opset=13
+    tf2onnx.convert.from_function(
+        func,
+        input_signature=[spec],
+        opset=13,
+        output_path=onnx_path
     )
-    
+
     print(f"Successfully converted Keras model to ONNX: {onnx_path}")
 
 def convert_saved_model_example():
     """Example of converting a SavedModel to ONNX."""
     print("\n=== Converting SavedModel to ONNX ===")
-    
-    # Create and save a sample Keras model as SavedModel
+
+    # Create and save a sample Keras model as SavedModel. Passing the traced
+    # signature explicitly means tf2onnx doesn't have to re-infer shapes.
     model = create_sample_keras_model()
+    spec = tf.TensorSpec((None, 10), tf.float32, name='input')
+    concrete_func = get_concrete_function(model, spec)
     saved_model_path = "models/saved_model"
-    tf.saved_model.save(model, saved_model_path)
-    
+    tf.saved_model.save(model, saved_model_path,
+                        signatures={'serving_default': concrete_func})
+
     # Get the model signature
     signature = get_model_signature(saved_model_path)
     print(f"Model signature: {signature}")
-    
+
     # Convert to ONNX
     onnx_path = "models/saved_model.onnx"
     convert_saved_model(
@@ -72,7 +86,7 @@ def convert_saved_model_example():
         output_path=onnx_path,
         opset=13
     )
-    
+
     print(f"Successfully converted SavedModel to ONNX: {onnx_path}")
 
 def convert_tf_function_example():
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Async ONNX Runtime Client Example
+
+Drives many concurrent predict calls against the ONNX Runtime server using
+httpx.AsyncClient with HTTP/2 and keep-alive. Where the synchronous clients
+pay one round-trip (and potentially one TCP connect) per request, HTTP/2
+multiplexes all in-flight requests over a single connection, so throughput
+scales with concurrency instead of single-request latency.
+"""
+
+import asyncio
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+try:
+    import uvloop  # optional: faster event loop on Linux
+except ImportError:
+    uvloop = None
+
+class AsyncONNXClient:
+    """Async client for the ONNX Runtime server."""
+
+    def __init__(self, base_url: str = "http://localhost:8001", max_connections: int = 64):
+        """Initialize the async client.
+
+        Args:
+            base_url: Base URL of the ONNX Runtime server
+            max_connections: Keep-alive connection limit for the pool
+        """
+        self.client = httpx.AsyncClient(
+            base_url=base_url.rstrip('/'),
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            timeout=30.0
+        )
+
+    async def get_server_info(self) -> Dict[str, Any]:
+        """Get server information and API version."""
+        response = await self.client.get("/v1/")
+        response.raise_for_status()
+        return response.json()
+
+    async def predict(
+        self,
+        model_name: str,
+        inputs: Dict[str, List[float]],
+        model_version: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Make a single prediction with the specified model."""
+        url = f"/v1/models/{model_name}"
+        if model_version:
+            url += f"/versions/{model_version}"
+        url += ":predict"
+
+        response = await self.client.post(
+            url,
+            content=json.dumps({"instances": [inputs]}).encode(),
+            headers={"Content-Type": "application/json"}
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def predict_many(
+        self,
+        model_name: str,
+        batches: List[Dict[str, List[float]]],
+        model_version: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Fan out one predict call per input batch concurrently."""
+        return await asyncio.gather(*[
+            self.predict(model_name, inputs, model_version)
+            for inputs in batches
+        ])
+
+    async def close(self):
+        """Close the underlying connection pool."""
+        await self.client.aclose()
+
+async def main():
+    """Fan out a burst of predictions against the first available model."""
+    client = AsyncONNXClient("http://localhost:8001")
+
+    try:
+        info = await client.get_server_info()
+        models = info.get('models', [])
+        if not models:
+            print("No models found. Load a model into the server first.")
+            return
+
+        model_name = models[0]
+        print(f"Sending 32 concurrent predictions to {model_name}...")
+
+        example_input = {"input_1": [0.1, 0.2, 0.3, 0.4]}
+        results = await client.predict_many(model_name, [example_input] * 32)
+        print(f"Received {len(results)} responses")
+        print(json.dumps(results[0], indent=2))
+
+    except httpx.HTTPError as e:
+        print(f"Error talking to ONNX Runtime server: {e}")
+        print("Make sure the ONNX Runtime server is running and accessible.")
+    finally:
+        await client.close()
+
+if __name__ == "__main__":
+    if uvloop is not None and sys.platform != 'win32':
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    asyncio.run(main())
@@ -11,6 +11,28 @@ import numpy as np
 from typing import Dict, Any, List
 import json
 
+try:
+    import orjson  # SIMD JSON with native numpy serialization
+except ImportError:
+    orjson = None
+
+try:
+    import tritonclient.grpc as grpcclient  # KServe v2 gRPC client
+except ImportError:
+    grpcclient = None
+
+def _json_dumps(obj) -> bytes:
+    """Serialize a payload to JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode()
+
+def _json_loads(data):
+    """Parse JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class ONNXClient:
     """Client for interacting with the ONNX Runtime server."""
     
@@ -22,7 +44,8 @@ class ONNXClient:
         """
         self.base_url = base_url.rstrip('/')
         self.session = requests.Session()
-    
+        self._grpc_client = None
+
     def get_server_metadata(self) -> Dict[str, Any]:
         """Get server metadata."""
         response = self.session.get(f"{self.base_url}/v1/", timeout=10)
@@ -61,16 +84,122 @@ class ONNXClient:
         
         response = self.session.post(
             url,
-            json=payload,
+            data=_json_dumps(payload),
             headers={"Content-Type": "application/json"},
             timeout=30
         )
         response.raise_for_status()
-        
+
         # Extract predictions from response
-        result = response.json()
+        result = _json_loads(response.content)
         return result.get("predictions", [{}])[0]  # Return first prediction
 
+    def predict_binary(
+        self,
+        model_name: str,
+        inputs: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """Make a prediction using the KServe v2 binary tensor protocol.
+
+        Sends raw little-endian FP32 bytes instead of JSON float lists, which
+        is ~4x less bandwidth and skips float parsing on both sides.
+
+        Args:
+            model_name: Name of the model to use for prediction
+            inputs: Dictionary mapping input names to float32 numpy arrays
+
+        Returns:
+            Dictionary mapping output names to numpy arrays
+        """
+        arrays = {name: np.ascontiguousarray(arr, dtype='<f4') for name, arr in inputs.items()}
+
+        header = _json_dumps({
+            "inputs": [
+                {
+                    "name": name,
+                    "shape": list(arr.shape),
+                    "datatype": "FP32",
+                    "parameters": {"binary_data_size": arr.nbytes},
+                }
+                for name, arr in arrays.items()
+            ]
+        })
+        body = header + b"".join(arr.tobytes() for arr in arrays.values())
+
+        response = self.session.post(
+            f"{self.base_url}/v2/models/{model_name}/infer",
+            data=body,
+            headers={
+                "Content-Type": "application/octet-stream",
+                "Inference-Header-Content-Length": str(len(header)),
+            },
+            timeout=30
+        )
+        response.raise_for_status()
+
+        # The response mirrors the request: a JSON header followed by the raw
+        # tensor bytes for each output marked with binary_data_size.
+        header_length = int(response.headers.get(
+            "Inference-Header-Content-Length", len(response.content)))
+        result = _json_loads(response.content[:header_length])
+
+        outputs = {}
+        offset = header_length
+        for output in result.get("outputs", []):
+            name = output["name"]
+            shape = output.get("shape", [])
+            binary_size = output.get("parameters", {}).get("binary_data_size")
+            if binary_size is not None:
+                outputs[name] = np.frombuffer(
+                    response.content, dtype='<f4', count=binary_size // 4, offset=offset
+                ).reshape(shape)
+                offset += binary_size
+            else:
+                outputs[name] = np.asarray(output.get("data", []), dtype=np.float32).reshape(shape)
+        return outputs
+
+    def predict_grpc(
+        self,
+        model_name: str,
+        inputs: Dict[str, np.ndarray],
+        grpc_url: str = "localhost:9001"
+    ) -> Dict[str, np.ndarray]:
+        """Make a prediction over the KServe v2 gRPC protocol.
+
+        Tensors travel as raw protobuf bytes on one multiplexed HTTP/2
+        connection, so there is no JSON encode/parse at all and many
+        in-flight calls share a single connection.
+
+        Args:
+            model_name: Name of the model to use for prediction
+            inputs: Dictionary mapping input names to float32 numpy arrays
+            grpc_url: host:port of the server's gRPC endpoint
+
+        Returns:
+            Dictionary mapping output names to numpy arrays
+        """
+        if grpcclient is None:
+            raise ImportError(
+                "tritonclient is required for gRPC inference. "
+                "Install with: pip install tritonclient[grpc]"
+            )
+
+        if self._grpc_client is None:
+            self._grpc_client = grpcclient.InferenceServerClient(url=grpc_url)
+
+        infer_inputs = []
+        for name, arr in inputs.items():
+            arr = np.ascontiguousarray(arr, dtype=np.float32)
+            infer_input = grpcclient.InferInput(name, list(arr.shape), "FP32")
+            infer_input.set_data_from_numpy(arr)
+            infer_inputs.append(infer_input)
+
+        result = self._grpc_client.infer(model_name, infer_inputs)
+        return {
+            output.name: result.as_numpy(output.name)
+            for output in result.get_response().outputs
+        }
+
 def main():
     """Run a simple example of using the ONNX Runtime client."""
     # Initialize client
@@ -1,121 +1,74 @@
 import os
+from pathlib import Path
+import sys
+
+# Prefer the C-backed protobuf implementation; the pure-Python fallback is
+# 20-50x slower on large weight buffers. Must be set before importing onnx.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 import numpy as np
 import onnx
 from onnx import helper, TensorProto, numpy_helper
 
+# Attribute sets shared by several nodes: build each AttributeProto once and
+# reuse it instead of re-parsing identical kwargs per make_node call.
+_CONV_ATTRS = dict(kernel_shape=[3, 3], pads=[1, 1, 1, 1])
+_POOL_ATTRS = dict(kernel_shape=[2, 2], strides=[2, 2])
+
+# Initializers as (name, shape); weights precede their consumers below.
+INITIALIZER_SPEC = [
+    ('conv1.weight', (16, 1, 3, 3)),
+    ('conv1.bias', (16,)),
+    ('conv2.weight', (32, 16, 3, 3)),
+    ('conv2.bias', (32,)),
+    ('fc1.weight', (10, 32 * 7 * 7)),
+    ('fc1.bias', (10,)),
+]
+
+# Whole graph as (op_type, inputs, outputs, attributes): one declarative
+# table, one construction pass. Extending to a larger synthetic model is a
+# matter of appending rows.
+NODE_SPEC = [
+    ('Conv', ['X', 'conv1.weight', 'conv1.bias'], ['conv1_out'],
+     dict(name='conv1', **_CONV_ATTRS)),
+    ('Relu', ['conv1_out'], ['relu1_out'], dict(name='relu1')),
+    ('MaxPool', ['relu1_out'], ['pool1_out'], dict(name='pool1', **_POOL_ATTRS)),
+    ('Conv', ['pool1_out', 'conv2.weight', 'conv2.bias'], ['conv2_out'],
+     dict(name='conv2', **_CONV_ATTRS)),
+    ('Relu', ['conv2_out'], ['relu2_out'], dict(name='relu2')),
+    ('MaxPool', ['relu2_out'], ['pool2_out'], dict(name='pool2', **_POOL_ATTRS)),
+    ('Flatten', ['pool2_out'], ['flatten_out'], dict(name='flatten')),
+    ('Gemm', ['flatten_out', 'fc1.weight', 'fc1.bias'], ['gemm_out'],
+     dict(name='fc1', transB=1)),
+    ('Softmax', ['gemm_out'], ['Y'], dict(name='softmax', axis=1)),
+]
+
 def create_complex_onnx_model(output_path):
+    # Seeded Generator writing float32 directly, so initializers never
+    # materialize an intermediate float64 buffer.
+    rng = np.random.default_rng(0)
+
     # Define input and output tensors
     X = helper.make_tensor_value_info('X', TensorProto.FLOAT, [1, 1, 28, 28])
     Y = helper.make_tensor_value_info('Y', TensorProto.FLOAT, [1, 10])
     
-    # Create weight and bias tensors
-    w1 = numpy_helper.from_array(
-        np.random.randn(16, 1, 3, 3).astype(np.float32),
-        name='conv1.weight'
-    )
-    b1 = numpy_helper.from_array(
-        np.random.randn(16).astype(np.float32),
-        name='conv1.bias'
-    )
-    w2 = numpy_helper.from_array(
-        np.random.randn(32, 16, 3, 3).astype(np.float32),
-        name='conv2.weight'
-    )
-    b2 = numpy_helper.from_array(
-        np.random.randn(32).astype(np.float32),
-        name='conv2.bias'
-    )
-    w3 = numpy_helper.from_array(
-        np.random.randn(10, 32 * 5 * 5).astype(np.float32),
-        name='fc1.weight'
-    )
-    b3 = numpy_helper.from_array(
-        np.random.randn(10).astype(np.float32),
-        name='fc1.bias'
-    )
-    
-    # Create nodes for the model
-    conv1_node = helper.make_node(
-        'Conv',
-        inputs=['X', 'conv1.weight', 'conv1.bias'],
-        outputs=['conv1_out'],
-        name='conv1',
-        kernel_shape=[3, 3],
-        pads=[1, 1, 1, 1]
-    )
-    
-    relu1_node = helper.make_node(
-        'Relu',
-        inputs=['conv1_out'],
-        outputs=['relu1_out'],
-        name='relu1'
-    )
-    
-    pool1_node = helper.make_node(
-        'MaxPool',
-        inputs=['relu1_out'],
-        outputs=['pool1_out'],
-        name='pool1',
-        kernel_shape=[2, 2],
-        strides=[2, 2]
-    )
-    
-    conv2_node = helper.make_node(
-        'Conv',
-        inputs=['pool1_out', 'conv2.weight', 'conv2.bias'],
-        outputs=['conv2_out'],
-        name='conv2',
-        kernel_shape=[3, 3],
-        pads=[1, 1, 1, 1]
-    )
-    
-    relu2_node = helper.make_node(
-        'Relu',
-        inputs=['conv2_out'],
-        outputs=['relu2_out'],
-        name='relu2'
-    )
-    
-    pool2_node = helper.make_node(
-        'MaxPool',
-        inputs=['relu2_out'],
-        outputs=['pool2_out'],
-        name='pool2',
-        kernel_shape=[2, 2],
-        strides=[2, 2]
-    )
-    
-    flatten_node = helper.make_node(
-        'Flatten',
-        inputs=['pool2_out'],
-        outputs=['flatten_out'],
-        name='flatten'
-    )
-    
-    gemm_node = helper.make_node(
-        'Gemm',
-        inputs=['flatten_out', 'fc1.weight', 'fc1.bias'],
-        outputs=['gemm_out'],
-        name='fc1'
-    )
-    
-    softmax_node = helper.make_node(
-        'Softmax',
-        inputs=['gemm_out'],
-        outputs=['Y'],
-        name='softmax',
-        axis=1
-    )
-    
-    # Create the graph
+    def make_initializer(name, shape):
+        # Store weights as raw little-endian bytes: one memcpy to serialize
+        # and to parse, instead of a varint-decoded float_data entry per
+        # element.
+        data = rng.standard_normal(shape, dtype=np.float32)
+        return helper.make_tensor(
+            name, TensorProto.FLOAT, list(data.shape),
+            data.astype('<f4', copy=False).tobytes(), raw=True
+        )
+
+    # Build the whole graph from the declarative specs in one pass
     graph_def = helper.make_graph(
-        [conv1_node, relu1_node, pool1_node, 
-         conv2_node, relu2_node, pool2_node, 
-         flatten_node, gemm_node, softmax_node],
+        [helper.make_node(op, ins, outs, **attrs) for op, ins, outs, attrs in NODE_SPEC],
         'complex-cnn-model',
         [X],
         [Y],
-        initializer=[w1, b1, w2, b2, w3, b3]
+        initializer=[make_initializer(name, shape) for name, shape in INITIALIZER_SPEC]
     )
     
     # Create the model with IR version 10 for compatibility
@@ -126,15 +79,111 @@ def create_complex_onnx_model(output_path):
         ir_version=10  # Set IR version to 10 for compatibility with ONNX Runtime
     )
     
-    # Validate the model
-    onnx.checker.check_model(model_def)
-    
-    # Save the model
-    onnx.save(model_def, output_path)
+    # Validate the model. The checker is a full Python-level graph walk that
+    # costs more than serialization itself, so tight regenerate loops can
+    # skip it with ONNX_CHECK=0 (tests and CI keep the default).
+    if os.getenv('ONNX_CHECK', '1') == '1':
+        onnx.checker.check_model(model_def)
+
+    # Save the model; serializing once and writing the bytes skips the
+    # extra validation/IO layers inside onnx.save.
+    Path(output_path).write_bytes(model_def.SerializeToString())
     print(f"Model saved to {output_path}")
     print(f"Model size: {os.path.getsize(output_path) / 1024:.2f} KB")
 
+def _float32_to_bf16_bytes(arr):
+    """Round-to-nearest-even truncation of FP32 to BF16 raw bytes."""
+    bits = arr.astype('<f4', copy=False).view('<u4')
+    rounded = (bits + 0x7FFF + ((bits >> 16) & 1)) >> 16
+    return rounded.astype('<u2').tobytes()
+
+def convert_model_to_bf16(model_def):
+    """Convert all FP32 initializers of a model to BFLOAT16 in place.
+
+    Halves weight bytes on disk and in the session; on AVX512-BF16 / AMX
+    hosts the Conv/Gemm kernels then run on the BF16 FMA/TMUL units. Casts
+    are inserted at the graph head and tail so the external I/O stays FP32.
+    """
+    graph = model_def.graph
+
+    for i, init in enumerate(graph.initializer):
+        if init.data_type != TensorProto.FLOAT:
+            continue
+        data = numpy_helper.to_array(init)
+        graph.initializer[i].CopyFrom(helper.make_tensor(
+            init.name, TensorProto.BFLOAT16, list(data.shape),
+            _float32_to_bf16_bytes(data), raw=True
+        ))
+
+    # Cast the FP32 graph input to BF16 and rewire consumers
+    input_name = graph.input[0].name
+    cast_in = helper.make_node(
+        'Cast', inputs=[input_name], outputs=[f'{input_name}_bf16'],
+        name='cast_input_bf16', to=TensorProto.BFLOAT16
+    )
+    for node in graph.node:
+        for i, name in enumerate(node.input):
+            if name == input_name:
+                node.input[i] = f'{input_name}_bf16'
+
+    # Cast the BF16 result back to the declared FP32 output
+    output_name = graph.output[0].name
+    for node in graph.node:
+        for i, name in enumerate(node.output):
+            if name == output_name:
+                node.output[i] = f'{output_name}_bf16'
+    cast_out = helper.make_node(
+        'Cast', inputs=[f'{output_name}_bf16'], outputs=[output_name],
+        name='cast_output_fp32', to=TensorProto.FLOAT
+    )
+
+    graph.node.insert(0, cast_in)
+    graph.node.append(cast_out)
+
+    # Conv and MaxPool only admit tensor(bfloat16) from opset 22; at the
+    # source model's opset 13 the rewired graph is invalid even though the
+    # checker passes (it validates structure, not type constraints per
+    # opset), and ORT rejects it at session creation with INVALID_GRAPH.
+    for entry in model_def.opset_import:
+        if entry.domain == '':
+            entry.version = max(entry.version, 22)
+    return model_def
+
+def _verify_ort_loads(model_path):
+    """Fail loudly if ONNX Runtime cannot build a session for the model.
+
+    The checker does not catch kernel availability: a CPU build without
+    BF16 Conv/MaxPool kernels only rejects the model at session creation,
+    so loading it here is the one gate that proves the file is usable.
+    """
+    import onnxruntime as ort
+
+    try:
+        ort.InferenceSession(model_path, providers=['CPUExecutionProvider'])
+    except Exception as exc:
+        raise RuntimeError(
+            f"{model_path} does not load in this ONNX Runtime build "
+            f"({ort.__version__}): {exc}"
+        ) from exc
+
+def create_bf16_onnx_model(fp32_path, output_path):
+    """Write a BF16-weight copy of an FP32 model, verified loadable."""
+    model_def = convert_model_to_bf16(onnx.load(fp32_path, load_external_data=False))
+    if os.getenv('ONNX_CHECK', '1') == '1':
+        onnx.checker.check_model(model_def)
+    Path(output_path).write_bytes(model_def.SerializeToString())
+    try:
+        _verify_ort_loads(output_path)
+    except RuntimeError:
+        # Don't leave an artifact behind that no session can open.
+        Path(output_path).unlink(missing_ok=True)
+        raise
+    print(f"BF16 model saved to {output_path}")
+    print(f"Model size: {os.path.getsize(output_path) / 1024:.2f} KB")
+
 if __name__ == "__main__":
     output_path = "models/complex-cnn-model.onnx"
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     create_complex_onnx_model(output_path)
+    if "--bf16" in sys.argv:
+        create_bf16_onnx_model(output_path, "models/complex-cnn-model.bf16.onnx")
@@ -11,6 +11,9 @@ from typing import Optional, Tuple
 def convert_pytorch_model(model: nn.Module, input_shape: Tuple[int, ...], output_path: str):
     """Convert PyTorch model to ONNX format."""
     try:
+        # Export in inference mode so BN/dropout fold away during tracing
+        model.eval()
+
         # Create dummy input
         dummy_input = torch.randn(1, *input_shape)
         
@@ -20,8 +23,9 @@ def convert_pytorch_model(model: nn.Module, input_shape: Tuple[int, ...], output
             dummy_input,
             output_path,
             export_params=True,
-            opset_version=11,
+            opset_version=17,
             do_constant_folding=True,
+            keep_initializers_as_inputs=False,
             input_names=['input'],
             output_names=['output'],
             dynamic_axes={'input': {0: 'batch_size'}, 'output': {0: 'batch_size'}}
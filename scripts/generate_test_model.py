@@ -1,7 +1,9 @@
 """Generate test ONNX models for testing."""
 
+import io
 import os
 import numpy as np
+import onnx
 import torch
 import torch.nn as nn
 from pathlib import Path
@@ -16,24 +18,29 @@ class SimpleModel(nn.Module):
     def forward(self, x):
         return self.relu(self.linear(x))
 
-def generate_onnx_model(output_path: str, input_shape: tuple = (1, 10)):
+def generate_onnx_model(output_path: str = None, input_shape: tuple = (1, 10)):
     """Generate a simple ONNX model for testing.
-    
+
     Args:
-        output_path: Path to save the ONNX model
+        output_path: Path to save the ONNX model. If None, the model is
+            exported to an in-memory buffer instead of the filesystem.
         input_shape: Input shape for the model
+
+    Returns:
+        io.BytesIO with the serialized model when output_path is None.
+        Pass its bytes to wronai_edge.ort_cache.load_cached to get a warm
+        InferenceSession without a disk round-trip.
     """
     model = SimpleModel()
     model.eval()
-    
+
     # Create dummy input
     dummy_input = torch.randn(*input_shape)
-    
-    # Export the model
-    torch.onnx.export(
-        model,
-        dummy_input,
-        output_path,
+
+    # Export the model (torch.onnx.export accepts a file-like target)
+    buffer = io.BytesIO() if output_path is None else None
+    target = buffer if output_path is None else output_path
+    export_kwargs = dict(
         input_names=['input'],
         output_names=['output'],
         dynamic_axes={
@@ -41,6 +48,36 @@ def generate_onnx_model(output_path: str, input_shape: tuple = (1, 10)):
             'output': {0: 'batch_size'}
         }
     )
+    try:
+        # Dynamo/FX exporter: emits an already-decomposed, fused graph that
+        # ONNX Runtime loads and runs faster than the TorchScript one.
+        torch.onnx.export(
+            model,
+            (dummy_input,),
+            target,
+            opset_version=18,
+            dynamo=True,
+            optimize=True,
+            **export_kwargs
+        )
+    except TypeError:
+        # Older PyTorch without the dynamo exporter
+        torch.onnx.export(
+            model,
+            dummy_input,
+            target,
+            opset_version=17,
+            do_constant_folding=True,
+            keep_initializers_as_inputs=False,
+            **export_kwargs
+        )
+
+    if buffer is not None:
+        buffer.seek(0)
+        return buffer
+
+    # Bake inferred shapes into the saved model so consumers skip the pass
+    onnx.shape_inference.infer_shapes_path(str(output_path), str(output_path))
 
 if __name__ == "__main__":
     # Create test models directory if it doesn't exist
@@ -2,12 +2,37 @@
 
 __version__ = "0.1.0"
 
-# Import key components for easier access
-from .models.validator import validate_model, validate_model_cli
-from .models.converter import convert_to_onnx
+# Map lazily exported names to the submodules that define them. The heavy
+# stacks behind these (onnxruntime, numpy, torch/tensorflow) load on first
+# attribute access instead of on every `import wronai_edge` (PEP 562).
+_LAZY = {
+    'validate_model': '.models.validator',
+    'validate_model_cli': '.models.validator',
+    'convert_model': '.converters',
+}
 
 __all__ = [
     'validate_model',
     'validate_model_cli',
-    'convert_to_onnx',
+    'convert_model',
 ]
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        # A failed submodule import must surface as AttributeError, not
+        # ImportError: hasattr()/dir()-driven introspection treats any
+        # other exception from __getattr__ as a crash.
+        try:
+            module = importlib.import_module(_LAZY[name], __name__)
+            value = getattr(module, name)
+        except ImportError as exc:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} ({exc})"
+            ) from exc
+        globals()[name] = value  # cache so __getattr__ runs once per name
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,13 @@
+"""Parsing helpers for command-line shape strings."""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+
+def parse_shape(s: str) -> Tuple[int, ...]:
+    """Parse a comma-separated shape string like ``1,3,224,224``."""
+    return tuple(map(int, s.split(',')))
+
+def parse_shapes(shapes: Optional[Sequence[str]]) -> Optional[List[Tuple[int, ...]]]:
+    """Parse a sequence of shape strings, or return None if empty."""
+    return [parse_shape(s) for s in shapes] if shapes else None
@@ -1,10 +1,26 @@
 """Edge AI command line interface."""
 
-import click
+import sys
+
 from wronai_edge.cli.main import cli
-from wronai_edge.cli.benchmark import benchmark
 
-# Register commands
-cli.add_command(benchmark)
+def _sniff_subcommand(argv):
+    """Return the subcommand named on the command line, if any.
+
+    The first token that does not look like a flag is the subcommand. This
+    lets us register only the command actually being run; everything else is
+    advertised through ``LazyGroup`` without being imported.
+    """
+    for arg in argv[1:]:
+        if not arg.startswith('-'):
+            return arg
+    return None
+
+_subcommand = _sniff_subcommand(sys.argv)
+if _subcommand == 'benchmark':
+    # The benchmark stack (onnxruntime, numpy, psutil) is about to be needed
+    # anyway, so resolve it up front instead of through LazyGroup dispatch.
+    from wronai_edge.cli.benchmark import benchmark
+    cli.add_command(benchmark)
 
 __all__ = ['cli']
@@ -1,10 +1,13 @@
 """CLI commands for model benchmarking."""
 
+from __future__ import annotations
+
 import click
 from pathlib import Path
 from typing import List, Optional
 
 # Use absolute imports
+from wronai_edge._shape_utils import parse_shapes
 from wronai_edge.benchmark import benchmark_model, compare_models, print_benchmark_results
 
 @click.command()
@@ -37,12 +40,7 @@ def benchmark(
         return
     
     # Parse input shapes
-    input_shapes = None
-    if input_shape:
-        input_shapes = [
-            tuple(int(dim) for dim in shape.split(','))
-            for shape in input_shape
-        ]
+    input_shapes = parse_shapes(input_shape)
     
     try:
         if compare and len(model_paths) > 1:
@@ -0,0 +1,26 @@
+"""Shared Rich console and status helpers for CLI commands."""
+
+from rich.console import Console
+
+console = Console()
+
+def print_success(message: str) -> None:
+    """Print a success message."""
+    console.print(f"[green]✓ {message}[/]")
+
+def print_error(message: str) -> None:
+    """Print an error message."""
+    console.print(f"[red]✗ {message}[/]")
+
+def print_warning(message: str) -> None:
+    """Print a warning message."""
+    console.print(f"[yellow]! {message}[/]")
+
+def print_traceback() -> None:
+    """Print the current exception traceback.
+
+    traceback (and the linecache/tokenize machinery it drags in) is only
+    imported here, on the first actual failure in verbose mode.
+    """
+    import traceback
+    console.print(traceback.format_exc())
@@ -0,0 +1,56 @@
+"""PyTorch-to-ONNX conversion command."""
+
+from __future__ import annotations
+
+import click
+
+from wronai_edge._shape_utils import parse_shape
+from wronai_edge.cli.console import console
+
+@click.command(name='convert-model')
+@click.option(
+    "--model-path",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Path to the PyTorch model file"
+)
+@click.option(
+    "--output-path",
+    required=True,
+    type=click.Path(dir_okay=False),
+    help="Output path for the ONNX model"
+)
+@click.option(
+    "--input-shape",
+    default="1,3,224,224",
+    help="Input shape for the model (comma-separated)",
+    show_default=True
+)
+def convert_model(model_path, output_path, input_shape):
+    """Convert a PyTorch model to ONNX format."""
+    from wronai_edge.converters import convert_model as convert_to_onnx
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    try:
+        input_shape = parse_shape(input_shape)
+        console.print(f"[bold]Converting model:[/] {model_path} -> {output_path}")
+        console.print(f"[dim]Input shape:[/] {input_shape}")
+
+        # 4 Hz refresh instead of Rich's default 10 Hz: conversions can run
+        # for a minute, and spinner redraws are pure overhead over SSH or on
+        # the small devices this CLI targets.
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            transient=True,
+            refresh_per_second=4,
+        ) as progress:
+            progress.add_task(description="Converting model...", total=None)
+            convert_to_onnx('pytorch', model_path, output_path,
+                            input_shape=input_shape)
+
+        console.print(f"[green]✓ Successfully converted model to:[/] {output_path}")
+
+    except Exception as e:
+        console.print(f"[red]Error converting model:[/] {str(e)}", style="bold")
+        raise click.Abort()
@@ -1,20 +1,58 @@
 """Edge AI Model Management CLI."""
 
+from __future__ import annotations
+
 import click
-import sys
-import os
-from pathlib import Path
-from typing import Optional, List, Tuple
 
-# Add the package root to the Python path
-package_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, package_root)
+class LazyGroup(click.Group):
+    """Click group that defers importing subcommand modules until invoked.
+
+    Subcommands registered through ``lazy_subcommands`` are advertised in
+    ``--help`` output, but their modules (and whatever heavy stacks they
+    pull in — onnxruntime, numpy, psutil) are only imported when the
+    subcommand is actually executed.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Maps command name -> (module path, attribute, short help)
+        self.lazy_subcommands = lazy_subcommands or {}
 
-# Now import the package modules
-from wronai_edge.converters import convert_model
-from wronai_edge.benchmark import benchmark_model, compare_models, print_benchmark_results
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
 
-@click.group()
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module_path, attr, _ = self.lazy_subcommands[cmd_name]
+            import importlib
+            return getattr(importlib.import_module(module_path), attr)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        # Click's default implementation resolves every command to read its
+        # short help, which would defeat the lazy imports on --help. Use the
+        # static help text from the registration table instead.
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_subcommands:
+                rows.append((name, self.lazy_subcommands[name][2]))
+            else:
+                command = super().get_command(ctx, name)
+                if command is None or command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str(limit=45)))
+        if rows:
+            with formatter.section('Commands'):
+                formatter.write_dl(rows)
+
+@click.group(cls=LazyGroup, lazy_subcommands={
+    'benchmark': ('wronai_edge.cli.benchmark', 'benchmark',
+                  "Benchmark ONNX model(s) performance."),
+    'convert-model': ('wronai_edge.cli.convert', 'convert_model',
+                      "Convert a PyTorch model to ONNX format."),
+    'test-model': ('wronai_edge.cli.test_model', 'test_model',
+                   "Validate and test an ONNX model."),
+})
 def cli():
     """Edge AI Model Management CLI"""
     pass
@@ -27,7 +65,7 @@ def cli():
 def convert(model_type: str, model_path: str, output: str, opset: int):
     """Convert a PyTorch or TensorFlow model to ONNX format"""
     from wronai_edge.converters import convert_model
-    
+
     try:
         output_path = convert_model(model_type, model_path, output, opset)
         click.echo(f"✓ Model converted successfully to {output_path}")
@@ -35,88 +73,5 @@ def convert(model_type: str, model_path: str, output: str, opset: int):
         click.echo(f"Error converting model: {str(e)}", err=True)
         raise click.Abort()
 
-@cli.command()
-@click.argument('model_paths', nargs=-1, type=click.Path(exists=True))
-@click.option('--input-shape', '-i', multiple=True, 
-              help='Input shape (e.g., 1,3,224,224). Can be specified multiple times for multiple inputs.')
-@click.option('--warmup', type=int, default=10, help='Number of warmup runs')
-@click.option('--runs', type=int, default=100, help='Number of benchmark runs')
-@click.option('--cpu/--gpu', default=False, help='Force CPU usage')
-@click.option('--compare', is_flag=True, help='Compare multiple models')
-def benchmark(
-    model_paths: List[str],
-    input_shape: List[str],
-    warmup: int,
-    runs: int,
-    cpu: bool,
-    compare: bool
-):
-    """Benchmark ONNX model(s) performance.
-    
-    Examples:
-        # Benchmark a single model
-        wronai_edge benchmark model.onnx -i 1,3,224,224
-        
-        # Compare multiple models
-        wronai_edge benchmark model1.onnx model2.onnx --compare
-    """
-    from ..benchmark import benchmark_model, compare_models, print_benchmark_results
-    
-    if not model_paths:
-        click.echo("Error: At least one model path must be provided.", err=True)
-        return
-    
-    # Parse input shapes
-    input_shapes = None
-    if input_shape:
-        input_shapes = [
-            tuple(int(dim) for dim in shape.split(','))
-            for shape in input_shape
-        ]
-    
-    try:
-        if compare and len(model_paths) > 1:
-            # Compare multiple models
-            results = {}
-            for model_path in model_paths:
-                click.echo(f"\nBenchmarking {Path(model_path).name}...")
-                results[model_path] = benchmark_model(
-                    model_path=model_path,
-                    input_shapes=input_shapes,
-                    warmup=warmup,
-                    runs=runs,
-                    use_gpu=not cpu
-                )
-            
-            click.echo("\n=== Benchmark Results ===")
-            print_benchmark_results(results)
-            
-        else:
-            # Benchmark a single model (legacy behavior)
-            if len(model_paths) > 1:
-                click.echo("Warning: Multiple models provided but --compare flag not set. "
-                          "Only the first model will be benchmarked.", err=True)
-            
-            model_path = model_paths[0]
-            click.echo(f"Benchmarking {model_path}...")
-            
-            result = benchmark_model(
-                model_path=model_path,
-                input_shapes=input_shapes,
-                warmup=warmup,
-                runs=runs,
-                use_gpu=not cpu
-            )
-            
-            click.echo("\n=== Benchmark Results ===")
-            print_benchmark_results({Path(model_path).name: result})
-            
-    except Exception as e:
-        click.echo(f"Error during benchmarking: {str(e)}", err=True)
-        raise click.Abort()
-
-# Import other command groups
-from wronai_edge.cli import benchmark as benchmark_commands
-
 if __name__ == '__main__':
     cli()
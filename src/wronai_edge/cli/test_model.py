@@ -0,0 +1,44 @@
+"""Model validation command."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from wronai_edge.cli.console import console, print_error, print_traceback
+
+@click.command(name='test-model')
+@click.option(
+    "--model-path",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Path to the ONNX model file"
+)
+@click.option(
+    "--output-json",
+    type=click.Path(writable=True, dir_okay=False, path_type=Path),
+    help="Save validation results to a JSON file"
+)
+@click.option("--no-cache", is_flag=True, help="Ignore cached validation results")
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
+@click.pass_context
+def test_model(ctx: click.Context, model_path: Path, output_json: Optional[Path],
+               no_cache: bool, verbose: bool):
+    """Validate and test an ONNX model."""
+    from wronai_edge.models.validator import validate_model_cli
+
+    if verbose:
+        console.print(f"[dim]Validating model: {model_path}[/]")
+
+    try:
+        success = validate_model_cli(str(model_path), str(output_json) if output_json else None,
+                                     use_cache=not no_cache)
+        if not success:
+            ctx.exit(1)
+    except Exception as e:
+        print_error(f"Error testing model: {str(e)}")
+        if verbose:
+            print_traceback()
+        ctx.exit(1)
@@ -0,0 +1 @@
+"""Model validation and conversion utilities."""
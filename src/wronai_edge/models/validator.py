@@ -0,0 +1,179 @@
+"""ONNX model validation utilities."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+# Bump when validation logic changes so stale cache entries are ignored.
+_VALIDATOR_VERSION = 1
+
+def _dim_or_one(dim: Any) -> int:
+    """Map a dynamic or symbolic dimension to 1 for test-input generation."""
+    return dim if isinstance(dim, int) and dim > 0 else 1
+
+def validate_model(model_path: str, sess_options=None) -> Dict[str, Dict[str, Any]]:
+    """
+    Validate an ONNX model.
+
+    Runs a series of checks against the model: that it loads and passes the
+    ONNX checker, that it declares inputs and outputs, and that a round of
+    inference on random data succeeds.
+
+    Args:
+        model_path: Path to the ONNX model file
+        sess_options: Optional preconfigured ``ort.SessionOptions``; for
+            tiny models, disabling graph optimization there makes session
+            creation cheaper than the inference itself
+
+    Returns:
+        Dictionary mapping check names to ``{'passed': bool, 'details': ...}``
+
+    Raises:
+        FileNotFoundError: If the model file does not exist
+        RuntimeError: If the model cannot be loaded or is structurally invalid
+    """
+    import onnx
+    import onnxruntime as ort
+
+    path = Path(model_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Model file not found: {model_path}")
+
+    results: Dict[str, Dict[str, Any]] = {}
+
+    try:
+        model = onnx.load(str(path))
+        onnx.checker.check_model(model)
+        session = ort.InferenceSession(str(path), providers=['CPUExecutionProvider'],
+                                       sess_options=sess_options)
+    except Exception as e:
+        raise RuntimeError(f"Failed to load model {model_path}: {e}") from e
+
+    results['model_loaded'] = {
+        'passed': True,
+        'details': {
+            'ir_version': model.ir_version,
+            'opset': max(op.version for op in model.opset_import),
+        }
+    }
+
+    input_details = {
+        input_.name: {
+            'shape': [_dim_or_one(dim) for dim in input_.shape],
+            'type': input_.type,
+        }
+        for input_ in session.get_inputs()
+    }
+    results['model_inputs'] = {
+        'passed': len(input_details) > 0,
+        'details': input_details,
+    }
+
+    output_details = {
+        output.name: {
+            'shape': [_dim_or_one(dim) for dim in output.shape],
+            'type': output.type,
+        }
+        for output in session.get_outputs()
+    }
+    results['model_outputs'] = {
+        'passed': len(output_details) > 0,
+        'details': output_details,
+    }
+
+    # Run one round of inference with random data to catch models that load
+    # but cannot actually execute.
+    try:
+        input_data = {
+            name: np.random.rand(*info['shape']).astype(np.float32)
+            for name, info in input_details.items()
+        }
+        outputs = session.run(None, input_data)
+        results['inference_test'] = {
+            'passed': True,
+            'details': {
+                output.name: {'shape': list(out.shape)}
+                for output, out in zip(session.get_outputs(), outputs)
+            }
+        }
+    except Exception as e:
+        results['inference_test'] = {
+            'passed': False,
+            'details': {'error': str(e)},
+        }
+
+    return results
+
+def _cache_path(model_path: str) -> Path:
+    return Path(model_path).with_suffix('.validate.json')
+
+def _cache_key(model_path: str) -> str:
+    st = os.stat(model_path)
+    return f"{st.st_size}-{st.st_mtime_ns}-v{_VALIDATOR_VERSION}"
+
+def _read_cached_results(model_path: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Return cached validation results if they match the current file."""
+    cache = _cache_path(model_path)
+    try:
+        entry = json.loads(cache.read_text())
+    except (OSError, ValueError):
+        return None
+    if entry.get('key') != _cache_key(model_path):
+        return None
+    return entry.get('results')
+
+def _write_cached_results(model_path: str, results: Dict[str, Dict[str, Any]]) -> None:
+    cache = _cache_path(model_path)
+    try:
+        cache.write_text(json.dumps({'key': _cache_key(model_path), 'results': results}))
+    except OSError:
+        # Read-only model directory; caching is best-effort.
+        pass
+
+def validate_model_cli(model_path: str, output_json: Optional[str] = None,
+                       use_cache: bool = True) -> bool:
+    """
+    Validate a model and print a human-readable report.
+
+    Results are memoized on disk next to the model, keyed on the file's size
+    and mtime, so re-running validation on an unchanged model skips session
+    creation entirely.
+
+    Args:
+        model_path: Path to the ONNX model file
+        output_json: Optional path to write the raw results as JSON
+        use_cache: Whether to reuse/write the on-disk result cache
+
+    Returns:
+        True if every check passed
+    """
+    from rich.console import Console
+
+    console = Console()
+
+    results = _read_cached_results(model_path) if use_cache else None
+    if results is None:
+        results = validate_model(model_path)
+        if use_cache:
+            _write_cached_results(model_path, results)
+    else:
+        console.print("[dim]Using cached validation results[/]")
+
+    all_passed = True
+    for check, outcome in results.items():
+        if outcome['passed']:
+            console.print(f"[green]✓ {check}[/]")
+        else:
+            all_passed = False
+            console.print(f"[red]✗ {check}: {outcome.get('details')}[/]")
+
+    if output_json:
+        Path(output_json).write_text(json.dumps(results, indent=2))
+        console.print(f"[dim]Results written to {output_json}[/]")
+
+    return all_passed
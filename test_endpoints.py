@@ -1,69 +1,65 @@
 import requests
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
-def test_ollama_endpoint():
-    """Test the Ollama API endpoint."""
+# One pooled session for all probes: the two Nginx checks reuse the same
+# connection instead of redoing the TCP handshake per request.
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
+
+# Everything is localhost, so fail fast: 2 s to connect, 5 s to read.
+TIMEOUT = (2, 5)
+
+def _probe(label, url):
+    """GET a health endpoint and report its status."""
     try:
-        url = "http://localhost:11435/api/tags"
-        response = requests.get(url, timeout=10)
-        print(f"Ollama API Status: {response.status_code}")
+        response = session.get(url, timeout=TIMEOUT)
+        print(f"{label} Status: {response.status_code}")
         print(f"Response: {response.text}")
         return response.status_code == 200
     except Exception as e:
-        print(f"Error testing Ollama endpoint: {e}")
+        print(f"Error testing {label}: {e}")
         return False
 
+def test_ollama_endpoint():
+    """Test the Ollama API endpoint."""
+    return _probe("Ollama API", "http://localhost:11435/api/tags")
+
 def test_onnx_endpoint():
     """Test the ONNX Runtime endpoint."""
-    try:
-        url = "http://localhost:8001/v1/"
-        response = requests.get(url, timeout=10)
-        print(f"ONNX Runtime Status: {response.status_code}")
-        print(f"Response: {response.text}")
-        return response.status_code == 200
-    except Exception as e:
-        print(f"Error testing ONNX Runtime endpoint: {e}")
-        return False
+    return _probe("ONNX Runtime", "http://localhost:8001/v1/")
 
 def test_nginx_gateway():
     """Test the Nginx gateway."""
-    try:
-        # Test Ollama through Nginx
-        url = "http://localhost:30080/api/tags"
-        response = requests.get(url, timeout=10)
-        print(f"Nginx -> Ollama Status: {response.status_code}")
-        
-        # Test ONNX Runtime through Nginx
-        url = "http://localhost:30080/v1/"
-        response = requests.get(url, timeout=10)
-        print(f"Nginx -> ONNX Runtime Status: {response.status_code}")
-        
-        return True
-    except Exception as e:
-        print(f"Error testing Nginx gateway: {e}")
-        return False
+    ollama_ok = _probe("Nginx -> Ollama", "http://localhost:30080/api/tags")
+    onnx_ok = _probe("Nginx -> ONNX Runtime", "http://localhost:30080/v1/")
+    return ollama_ok and onnx_ok
 
 def test_services():
     """Run all service tests."""
     print("=== Running Service Tests ===")
-    
-    # Test direct endpoints
-    print("\nTesting direct endpoints:")
-    ollama_ok = test_ollama_endpoint()
-    onnx_ok = test_onnx_endpoint()
-    
-    # Test through Nginx
-    print("\nTesting through Nginx gateway:")
-    nginx_ok = test_nginx_gateway()
-    
+
+    # The four probes are independent, so fire them concurrently: total
+    # wall-clock is one round-trip (or one timeout) instead of four.
+    probes = [
+        ("Ollama API", "http://localhost:11435/api/tags"),
+        ("ONNX Runtime", "http://localhost:8001/v1/"),
+        ("Nginx -> Ollama", "http://localhost:30080/api/tags"),
+        ("Nginx -> ONNX Runtime", "http://localhost:30080/v1/"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        results = list(executor.map(lambda p: _probe(*p), probes))
+    ollama_ok, onnx_ok, nginx_ollama_ok, nginx_onnx_ok = results
+
     # Print summary
     print("\n=== Test Summary ===")
     print(f"Ollama API: {'PASS' if ollama_ok else 'FAIL'}")
     print(f"ONNX Runtime: {'PASS' if onnx_ok else 'FAIL'}")
-    print(f"Nginx Gateway: {'PASS' if nginx_ok else 'FAIL'}")
-    
-    return all([ollama_ok, onnx_ok, nginx_ok])
+    print(f"Nginx Gateway: {'PASS' if nginx_ollama_ok and nginx_onnx_ok else 'FAIL'}")
+
+    return all(results)
 
 if __name__ == "__main__":
     success = test_services()
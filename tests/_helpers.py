@@ -0,0 +1,18 @@
+"""Shared helpers for the test suite."""
+
+import functools
+import os
+
+from wronai_edge.models.validator import validate_model
+
+@functools.lru_cache(maxsize=32)
+def _validate_cached(path, mtime, sess_options=None):
+    return validate_model(path, sess_options=sess_options)
+
+def cached_validate(path, sess_options=None):
+    """``validate_model`` memoized on the file's path and mtime.
+
+    Repeat validation of an unchanged model is a dict lookup; rewriting
+    the file changes the mtime and invalidates the entry automatically.
+    """
+    return _validate_cached(path, os.path.getmtime(path), sess_options)
@@ -0,0 +1,81 @@
+"""Shared fixtures for the test suite."""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from click.testing import CliRunner
+
+# No test needs a GPU, and on runners with onnxruntime-gpu installed the
+# CUDA provider probe alone costs seconds and hundreds of MB. (The memory
+# arena has no env-var switch; tests that care disable it per session via
+# SessionOptions.enable_cpu_mem_arena.)
+os.environ.setdefault('CUDA_VISIBLE_DEVICES', '')
+
+# Modules replaced by the framework_stubs fixture. One shared MagicMock
+# serves every entry: the tests only address these modules by name (patch
+# targets, from-imports), never by identity, and a single mock is much
+# cheaper to construct than one per module.
+FRAMEWORK_STUB_MODULES = (
+    'torch',
+    'onnx',
+    'onnx.checker',
+    'onnxruntime',
+    'tensorflow',
+    'tensorflow.compat',
+    'tensorflow.compat.v1',
+    'tensorflow.compat.v2',
+    'tensorflow.python.framework.tensor_spec',
+    'wronai_edge',
+    'wronai_edge.models',
+    'wronai_edge.models.validator',
+    'wronai_edge.models.converter',
+    'wronai_edge.cli',
+)
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow", action="store_true", default=False,
+        help="run tests marked slow (real ONNX Runtime inference)"
+    )
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: runs real ONNX Runtime inference; skipped unless --run-slow is given"
+    )
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+@pytest.fixture(scope="session")
+def runner():
+    """Shared CLI runner.
+
+    CliRunner is stateless between invocations, so one instance serves
+    the whole session instead of being rebuilt for every test.
+    """
+    return CliRunner()
+
+# Built once and reset per test: constructing a MagicMock is far more
+# expensive than reset_mock, and copying one is unsafe (copy.copy on a
+# MagicMock returns an auto-created child that shares call records).
+_FRAMEWORK_STUB = MagicMock()
+
+@pytest.fixture
+def framework_stubs(monkeypatch):
+    """Stub out heavy frameworks and the package for fully mocked CLI tests.
+
+    Installed per test through monkeypatch so sys.modules is restored
+    afterwards — unlike module-level assignment, this cannot leak mocks
+    into test modules that import the real package.
+    """
+    _FRAMEWORK_STUB.reset_mock(return_value=True, side_effect=True)
+    for name in FRAMEWORK_STUB_MODULES:
+        monkeypatch.setitem(sys.modules, name, _FRAMEWORK_STUB)
+    return _FRAMEWORK_STUB
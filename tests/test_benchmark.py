@@ -1,24 +1,23 @@
 """Tests for the benchmark module."""
 
-import os
 import pytest
-import numpy as np
-from pathlib import Path
+from collections import namedtuple
 from wronai_edge.benchmark import benchmark_model, compare_models
 
+ModelFixture = namedtuple('ModelFixture', ['path', 'model_bytes'])
+
 # Create a simple ONNX model for testing
 @pytest.fixture(scope="module")
 def test_onnx_model(tmp_path_factory):
-    import onnx
     from onnx import helper, TensorProto
-    
+
     # Create a simple model: Add operation
     node_def = helper.make_node(
         'Add',
         inputs=['x', 'y'],
         outputs=['z']
     )
-    
+
     graph_def = helper.make_graph(
         [node_def],
         'test-model',
@@ -28,20 +27,44 @@ def test_onnx_model(tmp_path_factory):
         ],
         [helper.make_tensor_value_info('z', TensorProto.FLOAT, [1, 3, 224, 224])]
     )
-    
-    model_def = helper.make_model(graph_def, producer_name='test-model')
+
+    # Pin an official opset: helper.make_model defaults to the newest onnx
+    # knows about, which the installed runtime may not accept yet.
+    model_def = helper.make_model(
+        graph_def,
+        producer_name='test-model',
+        opset_imports=[helper.make_opsetid('', 13)]
+    )
+    # Serialize once; tests that need another copy reuse the bytes instead
+    # of re-serializing or copying the file.
+    model_bytes = model_def.SerializeToString()
     model_path = tmp_path_factory.mktemp("models") / "test_model.onnx"
-    onnx.save(model_def, str(model_path))
-    return model_path
+    model_path.write_bytes(model_bytes)
+    return ModelFixture(model_path, model_bytes)
+
+def _test_session_options():
+    """Minimal session options for a 2-run microbenchmark.
+
+    No arena or memory patterns (which would dominate RSS) and a single
+    thread (spinning up a pool costs more than the runs themselves).
+    """
+    import onnxruntime as ort
+    opts = ort.SessionOptions()
+    opts.enable_cpu_mem_arena = False
+    opts.enable_mem_pattern = False
+    opts.intra_op_num_threads = 1
+    opts.inter_op_num_threads = 1
+    return opts
 
 def test_benchmark_model(test_onnx_model):
     """Test benchmarking a single model."""
     results = benchmark_model(
-        model_path=test_onnx_model,
+        model_path=test_onnx_model.path,
         input_shapes=[(1, 3, 224, 224), (1, 3, 224, 224)],
         warmup=1,
         runs=2,
-        use_gpu=False  # Use CPU for testing
+        use_gpu=False,  # Use CPU for testing
+        sess_options=_test_session_options()
     )
     
     assert 'avg_latency' in results
@@ -51,13 +74,13 @@ def test_benchmark_model(test_onnx_model):
 
 def test_compare_models(test_onnx_model, tmp_path):
     """Test comparing multiple models."""
-    # Create a copy of the test model to compare against itself
-    import shutil
+    # Create a copy of the test model to compare against itself, from the
+    # already-serialized bytes rather than a file-to-file copy.
     model_path2 = tmp_path / "test_model2.onnx"
-    shutil.copy(test_onnx_model, model_path2)
-    
+    model_path2.write_bytes(test_onnx_model.model_bytes)
+
     results = compare_models(
-        model_paths=[test_onnx_model, model_path2],
+        model_paths=[test_onnx_model.path, model_path2],
         input_shapes=[(1, 3, 224, 224), (1, 3, 224, 224)],
         warmup=1,
         runs=2,
@@ -1,100 +1,88 @@
 """Tests for the Edge AI CLI commands."""
 
 import json
-import tempfile
-from pathlib import Path
-from unittest.mock import patch
 
 import pytest
-from click.testing import CliRunner
 
-# Import the CLI module
-from wronai_edge.cli import cli  # noqa: E402
+from wronai_edge.cli import cli
 
+# Test models are generated lazily by session-scoped fixtures rather than
+# a module-level bootstrap: collection and unrelated test selection no
+# longer pay the numpy/onnx/torch imports, and environments missing those
+# packages skip instead of failing at import time.
 
-@pytest.fixture
-def runner():
-    """Fixture for CLI runner."""
-    return CliRunner()
+@pytest.fixture(scope="session")
+def onnx_model_path(tmp_path_factory):
+    """A minimal valid ONNX model, generated once per session."""
+    pytest.importorskip("onnx")
+    from onnx import helper, TensorProto
 
+    node = helper.make_node('Identity', inputs=['x'], outputs=['y'])
+    graph = helper.make_graph(
+        [node],
+        'cli-test-model',
+        [helper.make_tensor_value_info('x', TensorProto.FLOAT, [1, 4])],
+        [helper.make_tensor_value_info('y', TensorProto.FLOAT, [1, 4])],
+    )
+    model = helper.make_model(
+        graph,
+        producer_name='cli-test',
+        opset_imports=[helper.make_opsetid('', 13)]
+    )
+    path = tmp_path_factory.mktemp("cli_models") / "model.onnx"
+    path.write_bytes(model.SerializeToString())
+    return path
+
+@pytest.fixture(scope="session")
+def pytorch_model_path(tmp_path_factory):
+    """A tiny pickled PyTorch module, generated once per session.
+
+    A 1x1 conv so the converter's default image-shaped dummy input traces
+    it without extra flags.
+    """
+    torch = pytest.importorskip("torch")
+
+    path = tmp_path_factory.mktemp("cli_models") / "model.pt"
+    torch.save(torch.nn.Conv2d(3, 1, kernel_size=1), path)
+    return path
 
 def test_cli_help(runner):
     """Test the CLI help command."""
     result = runner.invoke(cli, ["--help"])
     assert result.exit_code == 0
     assert "Usage: cli [OPTIONS] COMMAND [ARGS]..." in result.output
+    # Lazy subcommands must still be advertised in the listing.
+    for name in ("benchmark", "convert", "test-model"):
+        assert name in result.output
 
-
-def test_test_model_command(runner):
-    """Test the test-model command with a mock model."""
-    with patch("wronai_edge.models.validator.validate_model") as mock_validate:
-        # Mock the validation result
-        mock_validate.return_value = {
-            "model_info": {"format": "ONNX", "version": 8},
-            "validation_results": {
-                "model_valid": True,
-                "checks": [
-                    {"name": "model_structure", "passed": True, "message": "Valid model structure"},
-                    {"name": "opset_version", "passed": True, "message": "Valid opset version"},
-                ],
-            },
-        }
-
-        with tempfile.NamedTemporaryFile(suffix=".onnx") as tmp:
-            result = runner.invoke(
-                cli,
-                ["test-model", tmp.name, "--output-json", "validation_results.json"],
-            )
-    
-    output_path = temp_dir / "output.onnx"
-    
-    # Test with required arguments
+def test_test_model_command(runner, onnx_model_path, tmp_path):
+    """Test the test-model command against a real model."""
+    output_json = tmp_path / "validation_results.json"
     result = runner.invoke(cli, [
-        "convert", "keras",
-        str(TEST_KERAS_MODEL_PATH),
-        str(output_path),
-        "--input-shape", "1,224,224,3"
+        "test-model",
+        "--model-path", str(onnx_model_path),
+        "--output-json", str(output_json),
+        "--no-cache",
     ])
-    
-    # If TensorFlow is not installed, the command should fail with exit code 1
-    if "No module named 'tensorflow'" in str(result.exception):
-        assert result.exit_code == 1
-    else:
-        assert result.exit_code == 0
-        assert "Successfully converted Keras model" in result.output
-        mock_convert.assert_called_once()
 
-@patch("wronai_edge.cli.convert_saved_model")
-def test_convert_saved_model_command(mock_convert, runner, temp_dir):
-    """Test the convert saved-model command."""
-    # Setup mock
-    mock_convert.return_value = None
-    
-    output_path = temp_dir / "output.onnx"
-    saved_model_dir = temp_dir / "saved_model"
-    saved_model_dir.mkdir()
-    
-    # Test with required arguments
+    assert result.exit_code == 0
+    results = json.loads(output_json.read_text())
+    assert results["model_loaded"]["passed"]
+    assert results["inference_test"]["passed"]
+
+def test_convert_command(runner, pytorch_model_path, tmp_path):
+    """Test converting a PyTorch model through the CLI."""
+    output_path = tmp_path / "output.onnx"
     result = runner.invoke(cli, [
-        "convert", "saved-model",
-        str(saved_model_dir),
-        str(output_path)
+        "convert", "pytorch",
+        str(pytorch_model_path),
+        "--output", str(output_path),
+        "--opset", "18",
     ])
-    
-    # If TensorFlow is not installed, the command should fail with exit code 1
-    if "No module named 'tensorflow'" in str(result.exception):
-        assert result.exit_code == 1
-    else:
-        assert result.exit_code == 0
-        assert "Successfully converted SavedModel" in result.output
-        mock_convert.assert_called_once()
 
-def test_verbose_flag(runner):
-    """Test the verbose flag."""
-    # Test with verbose flag
-    result = runner.invoke(cli, ["--version", "--verbose"])
     assert result.exit_code == 0
-    assert "Verbose mode enabled" in result.output
+    assert "converted successfully" in result.output
+    assert output_path.exists()
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,23 @@
+"""Validator error-path tests that need no valid model.
+
+Kept apart from test_model_validation.py so they stay off the slow
+marker and never trigger model generation: an invalid file is just
+bytes, and the nonexistent case needs no file at all.
+"""
+
+import pytest
+
+from wronai_edge.models.validator import validate_model
+
+def test_validate_invalid_model(tmp_path):
+    """Test validation of an invalid model file."""
+    invalid_model = tmp_path / "invalid_model.onnx"
+    invalid_model.write_bytes(b'INVALID_MODEL_DATA')
+
+    with pytest.raises(RuntimeError):
+        validate_model(str(invalid_model))
+
+def test_validate_nonexistent_model():
+    """Test validation with a non-existent model path."""
+    with pytest.raises(FileNotFoundError):
+        validate_model("nonexistent_model.onnx")